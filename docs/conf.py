@@ -97,6 +97,13 @@ smv_prebuild_command = "sphinx-apidoc --separate " \
 # -- OID registry construction
 
 
+def _load_registry(registry_path):
+    """Read and parse OID registry data."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(registry_path, "rb") as f:
+        return yaml.load(f, Loader=loader)  # noqa: S506
+
+
 class OidRegistry(docutils.parsers.rst.Directive):
     """RST directive to render OID registry data."""
 
@@ -109,8 +116,7 @@ class OidRegistry(docutils.parsers.rst.Directive):
     def run(self):
         """Process the directive."""
         registry_path = pathlib.Path(__file__).parent / self.options["path"]
-        with open(registry_path) as f:
-            data = yaml.safe_load(f)
+        data = _load_registry(registry_path)
         root = data["root"]
         arc = data["arc"]
 
@@ -135,18 +141,24 @@ class OidRegistry(docutils.parsers.rst.Directive):
 
         return [table]
 
-    def render_arc(self, root_oid, arc, body=None):
-        """Render the body of the table, recursively."""
-        if body is None:
-            body = docutils.nodes.tbody()
-        for roid, info in arc.items():
-            oid = f"{root_oid}.{roid}"
-            body.append(self.render_oid_row(oid, info))
+    def render_arc(self, root_oid, arc):
+        """Render the body of the table, depth-first."""
+        rows = []
+        stack = [(root_oid, iter(arc.items()))]
+        while stack:
+            parent_oid, items = stack[-1]
             try:
-                if (sub_arc := info.get("arc")) is not None:
-                    self.render_arc(oid, sub_arc, body=body)
-            except AttributeError:
+                roid, info = next(items)
+            except StopIteration:
+                stack.pop()
                 continue
+            oid = f"{parent_oid}.{roid}"
+            rows.append(self.render_oid_row(oid, info))
+            if isinstance(info, dict) and \
+                    (sub_arc := info.get("arc")) is not None:
+                stack.append((oid, iter(sub_arc.items())))
+        body = docutils.nodes.tbody()
+        body.extend(rows)
         return body
 
     def render_oid_row(self, oid, info):
@@ -19,26 +19,31 @@ import logging
 import pathlib
 import sys
 
-import coloredlogs
-
 import jsonschema
 
-import verboselogs
-
 import yaml
 
-log = verboselogs.VerboseLogger(__name__)
+log = logging.getLogger(__name__)
 
 LOG_FMT = "%(levelname)s %(message)s"
 LOG_FIELD_STYLES = {"levelname": {"bold": True, "color": "white"}}
 
 
+def setup_logging() -> None:
+    """Set up logging, with colored output only on an interactive terminal."""
+    if sys.stderr.isatty():
+        import coloredlogs
+        coloredlogs.install(level=logging.INFO,
+                            logger=log,
+                            fmt=LOG_FMT,
+                            field_styles=LOG_FIELD_STYLES)
+    else:
+        logging.basicConfig(level=logging.INFO, format=LOG_FMT)
+
+
 def main() -> int:
     """Validate registry data using schema."""
-    coloredlogs.install(level=logging.INFO,
-                        logger=log,
-                        fmt=LOG_FMT,
-                        field_styles=LOG_FIELD_STYLES)
+    setup_logging()
     base_path = pathlib.Path(__file__).parent
 
     schema_path = base_path / "schema.json"
@@ -87,7 +92,7 @@ def main() -> int:
             log.error(f"validation error:\n{err}")
         return 1
 
-    log.success("no errors found")
+    log.info("no errors found")
     return 0
 
 
@@ -12,7 +12,6 @@
 """ASN.1 data types and helpers."""
 from __future__ import annotations
 
-import contextlib
 import logging
 import threading
 import typing
@@ -33,14 +32,51 @@ InterfaceSubclass = typing.TypeVar("InterfaceSubclass",
 def append_info_object_set(obj_set: ASN1Class, *obj_ins: ASN1Class) -> None:
     """Append an instance to an existing object information set at runtime."""
     for ins in obj_ins:
-        log.info(f"Adding {obj_ins} to constraining object info set {obj_set}")
+        log.info("Adding %s to constraining object info set %s",
+                 obj_ins, obj_set)
         obj_set.get_val().root.append(ins.get_val())
-    log.info(f"re-building lookup table for {obj_set}")
+    log.info("re-building lookup table for %s", obj_set)
     pycrate_asn1rt.init.build_classset_dict(obj_set)
 
 
+class _Constructed:
+    """Context manager holding the class lock around a populated ASN1Obj."""
+
+    __slots__ = ("obj", "data")
+
+    def __init__(self, obj: Interface, data: ASN1ObjData) -> None:
+        self.obj = obj
+        self.data = data
+
+    def __enter__(self) -> ASN1Obj:
+        cls = self.obj.__class__
+        log.debug("trying to acquire lock for %s", cls)
+        cls._lock.acquire()
+        log.debug("instantiating ASN1Obj from data: %s", self.data)
+        try:
+            cls.content_syntax.set_val(self.data)
+        except BaseException:
+            cls.content_syntax.reset_val()
+            cls._lock.release()
+            raise
+        return cls.content_syntax
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        cls = self.obj.__class__
+        try:
+            cls.content_syntax.reset_val()
+        finally:
+            cls._lock.release()
+
+
 class Interface:
-    """Generic base ASN.1 type wrapping pycrates API."""
+    """Generic base ASN.1 type wrapping pycrates API.
+
+    Instances are immutable once constructed, so serialisations are cached
+    on first use.
+    """
+
+    __slots__ = ("_content_data", "_asn1", "_der", "_jer")
 
     content_syntax: ASN1Obj
     _lock = threading.Lock()
@@ -51,57 +87,55 @@ class Interface:
         super().__init_subclass__(**kwargs)
         cls._lock = threading.Lock()
 
-    def __init__(self, data: typing.Any) -> None:
-        """Initialise the instance from python data."""
-        log.info(f"starting initialisation of {self} ASN.1 content")
-        with self.constructed(data) as instance:
-            self._content_data = instance.get_val()
-        log.info(f"finished initialisation of {self} ASN.1 content")
+    def __init__(self, data: typing.Any, *, validate: bool = True) -> None:
+        """Initialise the instance from python data.
+
+        Unless validate is False, data is round-tripped through the pycrates
+        object. Skipping this is only safe for data produced by pycrates.
+        """
+        log.info("starting initialisation of %s ASN.1 content", self)
+        if validate:
+            with self.constructed(data) as instance:
+                self._content_data = instance.get_val()
+        else:
+            self._content_data = data
+        log.info("finished initialisation of %s ASN.1 content", self)
 
     @classmethod
     def from_data(cls: typing.Type[InterfaceSubclass],
-                  data: typing.Any) -> InterfaceSubclass:
+                  data: typing.Any, *,
+                  validate: bool = True) -> InterfaceSubclass:
         """Construct an instance from python data."""
-        log.info(f"creating new {cls} object")
+        log.info("creating new %s object", cls)
         self: InterfaceSubclass = cls.__new__(cls)
-        Interface.__init__(self, data)
+        Interface.__init__(self, data, validate=validate)
         return self
 
     @classmethod
     def from_der(cls: typing.Type[InterfaceSubclass],
                  der_data: bytes) -> InterfaceSubclass:
         """Construct an instance from DER encoded data."""
-        log.info(f"trying to acquire lock for {cls}")
+        log.debug("trying to acquire lock for %s", cls)
         with cls._lock:
-            log.info(f"deserialising {cls} object from DER data.")
+            log.info("deserialising %s object from DER data.", cls)
             with log_writer.redirect_stdout():
                 cls.content_syntax.from_der(der_data)
             data = cls.content_syntax.get_val()
             cls.content_syntax.reset_val()
-            log.info(f"finished deserialising {cls} object")
-        self: InterfaceSubclass = cls.__new__(cls)
-        Interface.__init__(self, data)
-        return self
+            log.info("finished deserialising %s object", cls)
+        return cls.from_data(data, validate=False)
 
     @property
     def content_data(self) -> ASN1ObjData:
         """Get the underlying python data for this type instance."""
         return self._content_data
 
-    @contextlib.contextmanager
     def constructed(self,
-                    data: typing.Optional[ASN1ObjData] = None) -> ASN1Obj:
+                    data: typing.Optional[ASN1ObjData] = None) -> _Constructed:
         """Provide a context manager to mediate the global pycrates object."""
         if data is None:
             data = self.content_data
-        log.info(f"trying to acquire lock for {self.__class__}")
-        with self._lock:
-            log.debug(f"instantiating ASN1Obj from data: {data}")
-            try:
-                self.content_syntax.set_val(data)
-                yield self.content_syntax
-            finally:
-                self.content_syntax.reset_val()
+        return _Constructed(self, data)
 
     def to_txt(self) -> str:
         """Get default text serialization."""
@@ -109,30 +143,42 @@ class Interface:
 
     def to_asn1(self) -> str:
         """Serialize as ASN.1 data."""
-        with self.constructed() as instance:
-            log.info(f"serialising object {self} to ASN.1 data encoding")
-            with log_writer.redirect_stdout():
-                val = instance.to_asn1()
-            log.info(f"finished serialising object {self}")
-        return typing.cast(str, val)
+        try:
+            return self._asn1
+        except AttributeError:
+            with self.constructed() as instance:
+                log.info("serialising object %s to ASN.1 data encoding", self)
+                with log_writer.redirect_stdout():
+                    val = instance.to_asn1()
+                log.info("finished serialising object %s", self)
+            self._asn1: str = typing.cast(str, val)
+        return self._asn1
 
     def to_der(self) -> bytes:
         """Serialize as DER."""
-        with self.constructed() as instance:
-            log.info(f"serialising object {self} to DER")
-            with log_writer.redirect_stdout():
-                val = instance.to_der()
-            log.info(f"finished serialising object {self}")
-        return typing.cast(bytes, val)
+        try:
+            return self._der
+        except AttributeError:
+            with self.constructed() as instance:
+                log.info("serialising object %s to DER", self)
+                with log_writer.redirect_stdout():
+                    val = instance.to_der()
+                log.info("finished serialising object %s", self)
+            self._der: bytes = typing.cast(bytes, val)
+        return self._der
 
     def to_jer(self) -> str:
         """Serialize as JER."""
-        with self.constructed() as instance:
-            log.info(f"serialising object {self} to JSON")
-            with log_writer.redirect_stdout():
-                val = instance.to_jer()
-            log.info(f"finished serialising object {self}")
-        return typing.cast(str, val)
+        try:
+            return self._jer
+        except AttributeError:
+            with self.constructed() as instance:
+                log.info("serialising object %s to JSON", self)
+                with log_writer.redirect_stdout():
+                    val = instance.to_jer()
+                log.info("finished serialising object %s", self)
+            self._jer: str = typing.cast(str, val)
+        return self._jer
 
     def to_json(self) -> str:
         """Serialize as JSON."""
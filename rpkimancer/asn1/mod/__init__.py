@@ -12,51 +12,96 @@
 """Compile and re-export the provided ASN.1 modules."""
 from __future__ import annotations
 
-import glob
+import hashlib
 import importlib.metadata
 import importlib.resources
 import logging
 import os
+import typing
 
-import pycrate_asn1c.asnproc as _asn1_compile
-import pycrate_asn1c.generator as _asn1_generate
-
-from ...utils import LogWriter
+from ...utils import LogWriter, entry_points
 
 log = logging.getLogger(__name__)
 log_writer = LogWriter(log, level=logging.INFO)
 
+DIGEST_HEADER = "# rpkimancer ASN.1 sources digest: "
+
+
+def _walk(path: str) -> typing.Iterator[str]:
+    """Recursively yield the paths of ASN.1 module files below path."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk(entry.path)
+            elif entry.name.endswith(".asn"):
+                yield entry.path
 
-def _compile_modules() -> None:
+
+def _compile_modules(mods_dir: typing.Optional[str] = None,
+                     output_path: typing.Optional[str] = None) -> None:
     log.info("Trying to compile ASN.1 modules sources")
     pkg_dir = os.path.dirname(__file__)
-    mods_dir = os.path.join(pkg_dir, "modules")
-    output_path = os.path.join(pkg_dir, "_mod.py")
+    if mods_dir is None:
+        mods_dir = os.path.join(pkg_dir, "modules")
+    if output_path is None:
+        output_path = os.path.join(pkg_dir, "_mod.py")
     mods = list()
     log.info("reading local distribution modules")
-    for path in glob.glob(os.path.join(mods_dir, "**", "*.asn")):
-        log.debug(f"Reading {path}")
-        with open(path) as f:
-            mods.append(f.read())
+    for path in sorted(_walk(mods_dir)):
+        log.debug("Reading %s", path)
+        with open(path, "rb") as f:
+            mods.append(f.read().decode("utf-8"))
     log.info("trying to find plugin provided modules")
     entry_point_name = "rpkimancer.asn1.modules"
-    entry_points = importlib.metadata.entry_points()
-    for entry_point in entry_points.get(entry_point_name, []):
+    for entry_point in entry_points(entry_point_name):
         mod = entry_point.load()
         for item in importlib.resources.contents(mod):
             if not importlib.resources.is_resource(mod, item):
                 continue
             if not item.endswith(".asn"):
                 continue
-            log.info(f"Reading {mod}.{item}")
-            with importlib.resources.open_text(mod, item) as f:
-                mods.append(f.read())
+            log.info("Reading %s.%s", mod, item)
+            source = importlib.resources.read_binary(mod, item)
+            mods.append(source.decode("utf-8"))
+    digest = _sources_digest(mods)
+    if _generated_digest(output_path) == digest:
+        log.info("%s is up to date, skipping compilation", output_path)
+        return
+    # only pay for importing the compiler when it is actually needed
+    import pycrate_asn1c.asnproc as _asn1_compile
+    import pycrate_asn1c.generator as _asn1_generate
     with log_writer.redirect_stdout():
         _asn1_compile.compile_text(mods)
         _asn1_generate.PycrateGenerator(dest=output_path)
+    with open(output_path, "r+") as f:
+        generated = f.read()
+        f.seek(0)
+        f.write(f"{DIGEST_HEADER}{digest}\n{generated}")
     log.info("Compilation done")
 
 
+def _sources_digest(mods: typing.List[str]) -> str:
+    """Calculate a digest over the ASN.1 sources and compiler version."""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(importlib.metadata.version("pycrate").encode())
+    for mod in mods:
+        hasher.update(b"\0")
+        hasher.update(mod.encode())
+    return hasher.hexdigest()
+
+
+def _generated_digest(path: str) -> typing.Optional[str]:
+    """Read the sources digest from the header of a generated module."""
+    try:
+        with open(path) as f:
+            header = f.readline()
+    except OSError:
+        return None
+    if not header.startswith(DIGEST_HEADER):
+        return None
+    return header[len(DIGEST_HEADER):].strip()
+
+
 _compile_modules()
 with log_writer.redirect_stdout():
     from ._mod import *  # noqa
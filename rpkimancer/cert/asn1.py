@@ -13,6 +13,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 
 from ..asn1 import Interface, append_info_object_set
@@ -25,28 +26,37 @@ log = logging.getLogger(__name__)
 class Certificate(Interface):
     """X.509 ASN.1 Certificate type - RFC5912."""
 
+    __slots__ = ()
+
     content_syntax = PKIX1Explicit_2009.Certificate
 
     @property
     def subject_public_key_info(self) -> SubjectPublicKeyInfo:
         """Get the subjectPublicKeyInfo of the Certificate."""
-        log.info(f"trying to get subjectPublicKeyInfo data from {self}")
+        log.info("trying to get subjectPublicKeyInfo data from %s", self)
         with self.constructed() as instance:
             data = instance.get_val_at(["toBeSigned", "subjectPublicKeyInfo"])
-        return SubjectPublicKeyInfo(data)
+        return SubjectPublicKeyInfo.from_data(data, validate=False)
 
     @classmethod
-    def register_ext_type(cls, ext_type: ASN1Class) -> None:
-        """Add EXTENSION instance to extnID constraint set."""
+    @functools.lru_cache(maxsize=None)
+    def _extn_set(cls) -> ASN1Class:
+        """Look up the extnID constraint set of the pycrates object."""
         tbs_cert = cls.content_syntax.get_internals()["cont"]["toBeSigned"]
         extns = tbs_cert.get_internals()["cont"]["extensions"]
         extn_item = extns.get_internals()["cont"]
         extn_item_id = extn_item.get_internals()["cont"]["extnID"]
-        extn_set = extn_item_id.get_const()["tab"]
-        append_info_object_set(extn_set, ext_type)
+        return extn_item_id.get_const()["tab"]
+
+    @classmethod
+    def register_ext_type(cls, ext_type: ASN1Class) -> None:
+        """Add EXTENSION instance to extnID constraint set."""
+        append_info_object_set(cls._extn_set(), ext_type)
 
 
 class SubjectPublicKeyInfo(Interface):
     """X.509 ASN.1 SubjectPublicKeyInfo type - RFC5912."""
 
+    __slots__ = ()
+
     content_syntax = PKIX1Explicit_2009.SubjectPublicKeyInfo
@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import logging
 import os
 import typing
@@ -23,7 +24,7 @@ from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 
-from . import asn1, extensions, oid
+from . import asn1, extensions, keys, oid
 from ..resources import AsResourcesInfo, IpResourcesInfo
 
 if typing.TYPE_CHECKING:
@@ -33,6 +34,34 @@ log = logging.getLogger(__name__)
 
 ManifestEntryInfo = typing.Tuple[str, bytes]
 
+# rfc6487 section 4.8.1
+CA_BASIC_CONSTRAINTS: typing.Final = x509.BasicConstraints(ca=True,
+                                                           path_length=None)
+
+
+def _key_usage(ca: bool) -> x509.KeyUsage:
+    return x509.KeyUsage(digital_signature=ca is False,
+                         key_cert_sign=ca is True,
+                         crl_sign=ca is True,
+                         content_commitment=False,
+                         key_encipherment=False,
+                         data_encipherment=False,
+                         key_agreement=False,
+                         encipher_only=False,
+                         decipher_only=False)
+
+
+# rfc6487 section 4.8.4
+KEY_USAGE: typing.Final = {ca: _key_usage(ca) for ca in (True, False)}
+
+# rfc6487 section 4.8.9
+RPKI_CERT_POLICIES: typing.Final = x509.CertificatePolicies([
+    x509.PolicyInformation(oid.RPKI_CERT_POLICY_OID, policy_qualifiers=None),
+])
+
+# rfc6487 section 4.3: one instance shared by all signatures
+HASH_ALGORITHM: typing.Final = hashes.SHA256()
+
 
 class BaseResourceCertificate:
     """Base RPKI Resource Certificate class - RFC6487."""
@@ -47,11 +76,21 @@ class BaseResourceCertificate:
                  ca: bool = False,
                  base_uri: str = "rsync://rpki.example.net/rpki",
                  ip_resources: typing.Optional[IpResourcesInfo] = None,
-                 as_resources: typing.Optional[AsResourcesInfo] = None) -> None:  # noqa: E501
-        """Initialise the Resource Certificate."""
-        log.info(f"doing base initialisation of {self}")
+                 as_resources: typing.Optional[AsResourcesInfo] = None,
+                 private_key: typing.Optional[rsa.RSAPrivateKey] = None,
+                 now: typing.Optional[datetime.datetime] = None) -> None:
+        """Initialise the Resource Certificate.
+
+        A pre-generated private_key may be supplied to avoid the cost of
+        generating a new RSA key pair for every certificate, and a shared
+        timestamp may be supplied as now when issuing objects in bulk.
+        """
+        log.info("doing base initialisation of %s", self)
         self._issuer = issuer
-        self._base_uri = urllib.parse.urlparse(base_uri)
+        parsed_uri = urllib.parse.urlparse(base_uri)
+        self._base_uri = parsed_uri.geturl()
+        self._uri_path = os.path.join(parsed_uri.hostname or "",
+                                      *parsed_uri.path.rstrip("/").split("/"))
 
         builder = x509.CertificateBuilder()
 
@@ -74,39 +113,35 @@ class BaseResourceCertificate:
             issuer_name = self.issuer.cert.subject
         builder = builder.issuer_name(issuer_name)
         # rfc6487 section 4.6
-        valid_from = datetime.datetime.utcnow()
+        if now is None:
+            now = datetime.datetime.utcnow()
+        valid_from = now
         valid_to = valid_from + datetime.timedelta(days=days)
         builder = builder.not_valid_before(valid_from) \
                          .not_valid_after(valid_to)
         # rfc6487 sect 4.7 and rfc7935 section 3
-        self._key = rsa.generate_private_key(public_exponent=65537,
-                                             key_size=2048)
+        if private_key is None:
+            private_key = keys.get()
+        elif private_key.key_size != keys.KEY_SIZE:
+            raise ValueError("RPKI certificates require a "
+                             f"{keys.KEY_SIZE}-bit RSA key, "
+                             f"got {private_key.key_size} bits")
+        self._key: typing.Optional[rsa.RSAPrivateKey] = private_key
+        self._public_key = private_key.public_key()
         builder = builder.public_key(self.public_key)
         # rfc6487 section 4.8.1
         if ca is True:
-            basic_constraints = x509.BasicConstraints(ca=True,
-                                                      path_length=None)
-            builder = builder.add_extension(basic_constraints, critical=True)
+            builder = builder.add_extension(CA_BASIC_CONSTRAINTS,
+                                            critical=True)
         # rfc6487 section 4.8.2
         ski = x509.SubjectKeyIdentifier.from_public_key(self.public_key)
         self._ski_digest = ski.digest
         builder = builder.add_extension(ski, critical=False)
         # rfc6487 section 4.8.3
         if self.issuer is not None:
-            aki = x509.AuthorityKeyIdentifier\
-                      .from_issuer_public_key(self.issuer.public_key)
-            builder = builder.add_extension(aki, critical=False)
+            builder = builder.add_extension(self.issuer.aki, critical=False)
         # rfc6487 section 4.8.4
-        key_usage = x509.KeyUsage(digital_signature=ca is False,
-                                  key_cert_sign=ca is True,
-                                  crl_sign=ca is True,
-                                  content_commitment=False,
-                                  key_encipherment=False,
-                                  data_encipherment=False,
-                                  key_agreement=False,
-                                  encipher_only=False,
-                                  decipher_only=False)
-        builder = builder.add_extension(key_usage, critical=True)
+        builder = builder.add_extension(KEY_USAGE[ca is True], critical=True)
         # rfc6487 section 4.8.6
         if self.issuer is not None and self.issuer.crldp is not None:
             builder = builder.add_extension(self.issuer.crldp, critical=False)
@@ -134,6 +169,7 @@ class BaseResourceCertificate:
             self._cert = typing.cast("CertificateAuthority", self).issue_cert()
         else:
             self._cert = self.issuer.issue_cert(self)
+        self._cert_der = self._cert.public_bytes(serialization.Encoding.DER)
 
     @property
     def sia(self) -> typing.Optional[x509.SubjectInformationAccess]:
@@ -143,11 +179,7 @@ class BaseResourceCertificate:
     @property
     def cps(self) -> typing.Optional[x509.CertificatePolicies]:
         """Construct the CPS extension."""
-        cps = x509.CertificatePolicies([
-            x509.PolicyInformation(oid.RPKI_CERT_POLICY_OID,
-                                   policy_qualifiers=None),
-        ])
-        return cps
+        return RPKI_CERT_POLICIES
 
     @property
     def mft_entry(self) -> typing.Optional[ManifestEntryInfo]:
@@ -164,12 +196,19 @@ class BaseResourceCertificate:
     @property
     def private_key(self) -> rsa.RSAPrivateKey:
         """Get the private part of the RSA key pair."""
+        if self._key is None:
+            raise ValueError(f"private key of {self} has been discarded")
         return self._key
 
+    def discard_private_key(self) -> None:
+        """Drop the reference to the private key once signing is complete."""
+        log.info("discarding private key of %s", self)
+        self._key = None
+
     @property
     def public_key(self) -> rsa.RSAPublicKey:
         """Get the public part of the RSA key pair."""
-        return self._key.public_key()
+        return self._public_key
 
     @property
     def cert_builder(self) -> x509.CertificateBuilder:
@@ -179,13 +218,12 @@ class BaseResourceCertificate:
     @property
     def base_uri(self) -> str:
         """Get the base URI of the RPKI publication service."""
-        return self._base_uri.geturl()
+        return self._base_uri
 
     @property
     def uri_path(self) -> str:
         """Get the relative filesystem path equivalent of base_uri."""
-        return os.path.join(self._base_uri.hostname or "",
-                            *self._base_uri.path.rstrip("/").split("/"))
+        return self._uri_path
 
     @property
     def cert(self) -> x509.Certificate:
@@ -195,7 +233,7 @@ class BaseResourceCertificate:
     @property
     def cert_der(self) -> bytes:
         """Get cert DER-encoded."""
-        return self.cert.public_bytes(serialization.Encoding.DER)
+        return self._cert_der
 
     @property
     def issuer(self) -> typing.Optional[CertificateAuthority]:
@@ -212,18 +250,26 @@ class BaseResourceCertificate:
         """Get the message digest of the SKI extension."""
         return self._ski_digest
 
-    @property
+    @functools.cached_property
     def asn1_cert(self) -> asn1.Certificate:
         """Get an ASN.1 Certificate for the certificate."""
-        log.info(f"Constructing ASN.1 Certificate from {self}")
-        log.debug(f"Using DER bytes:\n{self.cert_der.hex()}")
+        log.info("Constructing ASN.1 Certificate from %s", self)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Using DER bytes:\n%s", self.cert_der.hex())
         return asn1.Certificate.from_der(self.cert_der)
 
-    @property
+    @functools.cached_property
+    def spki_der(self) -> bytes:
+        """Get the DER encoded subjectPublicKeyInfo for the certificate."""
+        return self.public_key.public_bytes(serialization.Encoding.DER,
+                                            serialization.PublicFormat.SubjectPublicKeyInfo)  # noqa: E501
+
+    @functools.cached_property
     def subject_public_key_info(self) -> asn1.SubjectPublicKeyInfo:
         """Get the subjectPublicKeyInfo for the certificate."""
-        return self.asn1_cert.subject_public_key_info
+        return asn1.SubjectPublicKeyInfo.from_der(self.spki_der)
 
 
 ResourceCertificates = typing.Iterable[BaseResourceCertificate]
 ResourceCertificateList = typing.List[BaseResourceCertificate]
+ResourceCertificateTuple = typing.Tuple[BaseResourceCertificate, ...]
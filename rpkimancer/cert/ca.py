@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import base64
 import datetime
+import functools
 import logging
 import os
 import typing
@@ -29,6 +30,8 @@ if typing.TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+RevokedEntry = typing.Tuple[datetime.datetime, x509.RevokedCertificate]
+
 
 class CertificateAuthority(base.BaseResourceCertificate):
     """RPKI Certificate Authority - RFC6487."""
@@ -37,17 +40,21 @@ class CertificateAuthority(base.BaseResourceCertificate):
                  common_name: str = "CA",
                  crl_days: int = 7,
                  mft_days: int = 7,
+                 now: typing.Optional[datetime.datetime] = None,
                  **kwargs: typing.Any) -> None:
         """Initialise the Certificate Authority."""
-        log.info(f"doing initialisation of {self} as CertificateAuthority")
+        log.info("doing initialisation of %s as CertificateAuthority", self)
         self._issued: base.ResourceCertificateList = list()
         self.next_serial_number = 1
-        super().__init__(common_name=common_name, ca=True, **kwargs)
+        if now is None:
+            now = datetime.datetime.utcnow()
+        super().__init__(common_name=common_name, ca=True, now=now, **kwargs)
         # rfc 6487 section 5
         self.crl_days = crl_days
         self.next_crl_number = 0
+        self._revoked: typing.List[RevokedEntry] = list()
         self._crl: typing.Optional[x509.CertificateRevocationList] = None
-        self.issue_crl()
+        self.issue_crl(now=now)
         self.mft_days = mft_days
         self.next_mft_number = 0
 
@@ -59,45 +66,47 @@ class CertificateAuthority(base.BaseResourceCertificate):
     @property
     def crl_der(self) -> bytes:
         """Get the last CRL as DER-encoded bytes."""
-        return typing.cast(x509.CertificateRevocationList,
-                           self.crl).public_bytes(serialization.Encoding.DER)
+        return self._crl_der
 
-    @property
+    @functools.cached_property
     def repo_path(self) -> str:
         """Get the filesystem path to this CA's publication point."""
-        return os.path.join(typing.cast(CertificateAuthority,
-                                        self.issuer).repo_path,
-                            self.subject_cn)
+        issuer = typing.cast(CertificateAuthority, self.issuer)
+        return f"{issuer.repo_path}/{self.subject_cn}"
 
-    @property
+    @functools.cached_property
     def cert_path(self) -> str:
         """Get the filesystem path to cert in the issuer publication point."""
-        return os.path.join(typing.cast(CertificateAuthority,
-                                        self.issuer).repo_path,
-                            f"{self.subject_cn}.cer")
+        issuer = typing.cast(CertificateAuthority, self.issuer)
+        return f"{issuer.repo_path}/{self.subject_cn}.cer"
 
     @property
     def mft_entry(self) -> typing.Optional[base.ManifestEntryInfo]:
         """Get an entry for inclusion in the issuer's manifest."""
         return (os.path.basename(self.cert_path), self.cert_der)
 
-    @property
+    @functools.cached_property
     def crl_path(self) -> str:
         """Get the filesystem path to the CRL in publication point."""
-        return os.path.join(self.repo_path, "revoked.crl")
+        return f"{self.repo_path}/revoked.crl"
 
-    @property
+    @functools.cached_property
     def mft_path(self) -> str:
         """Get the filesystem path to the manifest in publication point."""
-        return os.path.join(self.repo_path, "manifest.mft")
+        return f"{self.repo_path}/manifest.mft"
 
     @property
-    def issued(self) -> base.ResourceCertificates:
-        """Get a generator over the certifactes issued by this CA."""
-        for cert in self._issued:
-            yield cert
+    def issued(self) -> base.ResourceCertificateTuple:
+        """Get a snapshot of the certificates issued by this CA."""
+        return tuple(self._issued)
 
-    @property
+    @functools.cached_property
+    def aki(self) -> x509.AuthorityKeyIdentifier:
+        """Get the AuthorityKeyIdentifier extension for issued objects."""
+        return x509.AuthorityKeyIdentifier\
+                   .from_issuer_public_key(self.public_key)
+
+    @functools.cached_property
     def crldp(self) -> typing.Optional[x509.CRLDistributionPoints]:
         """Get the CRLDistributionPoint extension for the certificate."""
         crldp_uri = f"{self.base_uri}/{self.crl_path}"
@@ -109,7 +118,7 @@ class CertificateAuthority(base.BaseResourceCertificate):
         ])
         return crldp
 
-    @property
+    @functools.cached_property
     def aia(self) -> typing.Optional[x509.AuthorityInformationAccess]:
         """Get the AuthorityInformationAccess extension for the certificate."""
         aia_uri = f"{self.base_uri}/{self.cert_path}"
@@ -119,7 +128,7 @@ class CertificateAuthority(base.BaseResourceCertificate):
         ])
         return aia
 
-    @property
+    @functools.cached_property
     def sia(self) -> typing.Optional[x509.SubjectInformationAccess]:
         """Get the SubjectInformationAccess extension for the certificate."""
         sia_repo_uri = f"{self.base_uri}/{self.repo_path}"
@@ -138,48 +147,57 @@ class CertificateAuthority(base.BaseResourceCertificate):
         if subject is None:
             subject = self
         cert = subject.cert_builder.sign(private_key=self.private_key,
-                                         algorithm=self.hash_algorithm())
+                                         algorithm=base.HASH_ALGORITHM)
         self._issued.append(subject)
         self.next_serial_number += 1
         return cert
 
     def issue_crl(self,
-                  to_revoke: typing.Optional[base.ResourceCertificates] = None) -> None:  # noqa: E501
+                  to_revoke: typing.Optional[base.ResourceCertificates] = None,
+                  now: typing.Optional[datetime.datetime] = None) -> None:
         """Issue a new CRL for this CA."""
-        now = datetime.datetime.utcnow()
+        if now is None:
+            now = datetime.datetime.utcnow()
         next_update = now + datetime.timedelta(days=self.crl_days)
         crl_builder = x509.CertificateRevocationListBuilder()
         crl_builder = crl_builder.issuer_name(self.cert.subject)
         crl_builder = crl_builder.last_update(now)
         crl_builder = crl_builder.next_update(next_update)
-        aki = x509.AuthorityKeyIdentifier\
-                  .from_issuer_public_key(self.public_key)
-        crl_builder = crl_builder.add_extension(aki, critical=False)
+        crl_builder = crl_builder.add_extension(self.aki, critical=False)
         crl_number = x509.CRLNumber(self.next_crl_number)
         crl_builder = crl_builder.add_extension(crl_number, critical=False)
+        # rfc5280 section 3.3: an entry may be removed once it has appeared
+        # on a CRL issued after the revoked certificate expired
         if self.crl is not None:
-            for revoked in self.crl:
-                # TODO: clean up expired certs
-                crl_builder = crl_builder.add_revoked_certificate(revoked)
+            last_update = self.crl.last_update
+            self._revoked = [(not_after, revoked_cert)
+                             for not_after, revoked_cert in self._revoked
+                             if not_after >= last_update]
         if to_revoke is not None:
             for c in to_revoke:
                 rc_builder = x509.RevokedCertificateBuilder()
                 rc_builder = rc_builder.revocation_date(now)
                 rc_builder = rc_builder.serial_number(c.cert.serial_number)
-                revoked_cert = rc_builder.build()
-                crl_builder = crl_builder.add_revoked_certificate(revoked_cert)
-        self._crl = crl_builder.sign(self.private_key, self.hash_algorithm())
+                self._revoked.append((c.cert.not_valid_after,
+                                      rc_builder.build()))
+        for _, revoked_cert in self._revoked:
+            crl_builder = crl_builder.add_revoked_certificate(revoked_cert)
+        self._crl = crl_builder.sign(self.private_key, base.HASH_ALGORITHM)
+        self._crl_der = self._crl.public_bytes(serialization.Encoding.DER)
         self.next_crl_number += 1
 
     def issue_mft(self,
-                  file_list: typing.List[base.ManifestEntryInfo]) -> None:
+                  file_list: typing.List[base.ManifestEntryInfo],
+                  now: typing.Optional[datetime.datetime] = None) -> None:
         """Issue a new manifest for this CA."""
-        now = datetime.datetime.utcnow()
+        if now is None:
+            now = datetime.datetime.utcnow()
         next_update = now + datetime.timedelta(days=self.mft_days)
         from ..sigobj import RpkiManifest
         self._mft = RpkiManifest(issuer=self,
                                  file_name=os.path.basename(self.mft_path),
                                  manifest_number=self.next_mft_number,
+                                 now=now,
                                  this_update=now,
                                  next_update=next_update,
                                  file_list=file_list)
@@ -193,8 +211,15 @@ class CertificateAuthority(base.BaseResourceCertificate):
     def publish(self, *,
                 pub_path: str,
                 recursive: bool = True,
+                now: typing.Optional[datetime.datetime] = None,
                 **kwargs: typing.Any) -> None:
-        """Publish this CA's artifacts as DER files in the PP."""
+        """Publish this CA's artifacts as DER files in the PP.
+
+        A single timestamp, now, is shared by every manifest issued while
+        publishing recursively.
+        """
+        if now is None:
+            now = datetime.datetime.utcnow()
         mft_file_list = list()
         full_pub_path = os.path.join(pub_path, self.uri_path)
         os.makedirs(os.path.join(full_pub_path, self.repo_path), exist_ok=True)
@@ -211,8 +236,9 @@ class CertificateAuthority(base.BaseResourceCertificate):
                 if recursive is True:
                     issuee.publish(pub_path=pub_path,
                                    recursive=recursive,
+                                   now=now,
                                    **kwargs)
-        self.issue_mft(mft_file_list)
+        self.issue_mft(mft_file_list, now=now)
         with open(os.path.join(full_pub_path, self.mft_path), "wb") as f:
             f.write(self.mft.to_der())
 
@@ -225,15 +251,15 @@ class TACertificateAuthority(CertificateAuthority):
                  base_uri: str = "rsync://rpki.example.net/rpki",
                  **kwargs: typing.Any) -> None:
         """Initialise the Certificate Authority."""
-        log.info(f"doing initialisation of {self} as TACertificateAuthority")
+        log.info("doing initialisation of %s as TACertificateAuthority", self)
         super().__init__(common_name=common_name, issuer=None, **kwargs)
 
-    @property
+    @functools.cached_property
     def repo_path(self) -> str:
         """Get the filesystem path to this CA's publication point."""
         return self.subject_cn
 
-    @property
+    @functools.cached_property
     def cert_path(self) -> str:
         """Get the filesystem path to cert in the publication point root."""
         return f"{self.subject_cn}.cer"
@@ -247,7 +273,7 @@ class TACertificateAuthority(CertificateAuthority):
     def tal(self) -> bytes:
         """Get the contents of the TAL for this trust anchor."""
         tal_contents = f"{self.base_uri}/{self.cert_path}\n\n".encode()
-        tal_contents += base64.b64encode(self.subject_public_key_info.to_der())
+        tal_contents += base64.b64encode(self.spki_der)
         return tal_contents
 
     def publish(self, *,
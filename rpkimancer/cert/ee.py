@@ -13,6 +13,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import typing
 
@@ -45,7 +46,7 @@ class EECertificate(base.BaseResourceCertificate, typing.Generic[ECT]):
         """Get the SignedObject that this certificate signs."""
         return self._signed_object
 
-    @property
+    @functools.cached_property
     def issuer_repo_path(self) -> str:
         """Get the filesystem path to the the issuer publication point."""
         return typing.cast(ca.CertificateAuthority, self.issuer).repo_path
@@ -56,7 +57,7 @@ class EECertificate(base.BaseResourceCertificate, typing.Generic[ECT]):
         return (self.signed_object.file_name,
                 self.signed_object.to_der())
 
-    @property
+    @functools.cached_property
     def sia(self) -> typing.Optional[x509.SubjectInformationAccess]:
         """Get the SubjectInformationAccess extension for the certificate."""
         sia_obj_uri = f"{self.base_uri}/" \
@@ -73,7 +74,7 @@ class EECertificate(base.BaseResourceCertificate, typing.Generic[ECT]):
         message = self.signed_object.econtent.signed_attrs().to_der()
         signature = self.private_key.sign(data=message,
                                           padding=padding.PKCS1v15(),
-                                          algorithm=self.hash_algorithm())
+                                          algorithm=base.HASH_ALGORITHM)
         return signature
 
     def publish(self, *, pub_path: str, **kwargs: typing.Any) -> None:
@@ -12,6 +12,7 @@
 """Number Resource Extension implementations - RFC3779."""
 from __future__ import annotations
 
+import functools
 import logging
 import typing
 
@@ -20,11 +21,26 @@ from cryptography import x509
 from . import asn1, oid
 from ..asn1.mod import IPAddrAndASCertExtn
 from ..asn1.types import ASN1Class
-from ..resources import (ASIdentifiers, AsResourcesInfo,
-                         IPAddrBlocks, IpResourcesInfo)
+from ..resources import (ASIdOrRangeInfo, ASIdentifiers, AsResourcesInfo,
+                         INHERIT_AS, IPAddrBlocks, IPAddressFamilyInfo,
+                         Inherit, IpResourcesInfo)
 
 log = logging.getLogger(__name__)
 
+RESOURCES_CACHE_SIZE: typing.Final = 4096
+
+
+@functools.lru_cache(maxsize=RESOURCES_CACHE_SIZE)
+def _ip_addr_blocks_der(ip_resources: typing.Tuple[IPAddressFamilyInfo, ...]) -> bytes:  # noqa: E501
+    """Get DER-encoded IPAddrBlocks, memoised on the resources."""
+    return IPAddrBlocks(ip_resources).to_der()
+
+
+@functools.lru_cache(maxsize=RESOURCES_CACHE_SIZE)
+def _as_identifiers_der(as_resources: typing.Union[Inherit, typing.Tuple[ASIdOrRangeInfo, ...]]) -> bytes:  # noqa: E501
+    """Get DER-encoded ASIdentifiers, memoised on the resources."""
+    return ASIdentifiers(as_resources).to_der()
+
 
 class X509CertificateExtension(x509.UnrecognizedExtension):
     """Custom certificate extension with ASN.1 handling."""
@@ -45,7 +61,7 @@ class IpResources(X509CertificateExtension,
 
     def __init__(self, ip_resources: IpResourcesInfo) -> None:
         """Initialise the certificate extension."""
-        ip_address_blocks_data = IPAddrBlocks(ip_resources).to_der()
+        ip_address_blocks_data = _ip_addr_blocks_der(tuple(ip_resources))
         super().__init__(oid.IP_RESOURCES_OID, ip_address_blocks_data)
 
 
@@ -55,5 +71,7 @@ class AsResources(X509CertificateExtension,
 
     def __init__(self, as_resources: AsResourcesInfo) -> None:
         """Initialise the certificate extension."""
-        as_identifiers_data = ASIdentifiers(as_resources).to_der()
+        if as_resources != INHERIT_AS:
+            as_resources = tuple(as_resources)
+        as_identifiers_data = _as_identifiers_der(as_resources)
         super().__init__(oid.AS_RESOURCES_OID, as_identifiers_data)
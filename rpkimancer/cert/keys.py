@@ -0,0 +1,88 @@
+# Copyright (c) 2021 Ben Maddison. All rights reserved.
+#
+# The contents of this file are licensed under the MIT License
+# (the "License"); you may not use this file except in compliance with the
+# License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""RSA key pair generation for RPKI Resource Certificates."""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import typing
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+log = logging.getLogger(__name__)
+
+# rfc7935 section 3
+KEY_SIZE: typing.Final = 2048
+PUBLIC_EXPONENT: typing.Final = 65537
+
+ThreadList = typing.List[threading.Thread]
+
+_pool: queue.SimpleQueue[rsa.RSAPrivateKey] = queue.SimpleQueue()
+
+
+def generate() -> rsa.RSAPrivateKey:
+    """Generate a new RSA key pair."""
+    return rsa.generate_private_key(public_exponent=PUBLIC_EXPONENT,
+                                    key_size=KEY_SIZE)
+
+
+def _fill(pool: queue.SimpleQueue[rsa.RSAPrivateKey],
+          generator: typing.Callable[[], rsa.RSAPrivateKey],
+          count: int) -> None:
+    for _ in range(count):
+        pool.put(generator())
+    log.debug("generated %d key pairs in the background", count)
+
+
+def _reset_pool() -> None:
+    # a forked child must not hand out the same keys as its parent
+    global _pool
+    _pool = queue.SimpleQueue()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def prewarm(count: int,
+            workers: typing.Optional[int] = None) -> ThreadList:
+    """Start generating count key pairs in the background.
+
+    Key generation happens in daemon threads: OpenSSL does not hold the GIL
+    while searching for primes, so this overlaps with other work. Keys that
+    are not ready when requested are generated inline by get().
+
+    The started threads are returned so that callers may wait for them.
+    """
+    workers = min(count, workers or os.cpu_count() or 1)
+    log.info("pre-generating %d key pairs using %d threads", count, workers)
+    threads = list()
+    for i in range(workers):
+        share = count // workers + (i < count % workers)
+        thread = threading.Thread(target=_fill,
+                                  args=(_pool, generate, share),
+                                  name=f"rpkimancer-keygen-{i}",
+                                  daemon=True)
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+def get() -> rsa.RSAPrivateKey:
+    """Get a pre-generated key pair, or generate one if none is ready."""
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        return generate()
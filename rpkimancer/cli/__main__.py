@@ -15,11 +15,11 @@
 
 from __future__ import annotations
 
-import importlib.metadata
 import logging
 import typing
 
 from . import Args, BaseCommand, OptionalArgv, Return
+from ..utils import entry_points
 
 log = logging.getLogger(__name__)
 
@@ -37,8 +37,7 @@ class Cli(BaseCommand):
         subcommands = self.default_subcommands
         log.info("trying to load plugins")
         entry_point_name = "rpkimancer.cli"
-        entry_points = importlib.metadata.entry_points()
-        for entry_point in entry_points.get(entry_point_name, []):
+        for entry_point in entry_points(entry_point_name):
             cls = entry_point.load()
             if issubclass(cls, BaseCommand):
                 subcommands.append(cls)
@@ -14,7 +14,6 @@
 from __future__ import annotations
 
 import argparse
-import importlib.metadata
 import ipaddress
 import logging
 import os
@@ -22,6 +21,7 @@ import typing
 
 from . import Args, BaseCommand, Return
 from .helpers import as_id_or_range, ip_resource, roa_network
+from ..utils import entry_points
 
 if typing.TYPE_CHECKING:
     from ..cert import CertificateAuthority
@@ -46,6 +46,12 @@ DEFAULT_GBR_FULLNAME = "Jane Doe"
 DEFAULT_GBR_ORG = "Example Org"
 DEFAULT_GBR_EMAIL = "jane@example.net"
 
+# CA, ROA and GBR EE certificates, and a manifest EE per CA: the TA key is
+# needed immediately, so it is generated inline while these are prepared
+# in the background. Objects built by plugins fall back to inline
+# generation once the pool is drained.
+PREWARM_KEY_COUNT = 5
+
 META_PATH = "<path>"
 META_AS = "<asn>"
 META_AS_RANGE = f"{META_AS}[-{META_AS}]"
@@ -68,8 +74,7 @@ class Conjure(BaseCommand):
         log.info("trying to load plugins")
         self._plugins = list()
         entry_point_name = "rpkimancer.cli.conjure"
-        entry_points = importlib.metadata.entry_points()
-        for entry_point in entry_points.get(entry_point_name, []):
+        for entry_point in entry_points(entry_point_name):
             cls = entry_point.load()
             if issubclass(cls, ConjurePlugin):
                 plugin = cls(self.parser)
@@ -143,12 +148,14 @@ class Conjure(BaseCommand):
             **kwargs: typing.Any) -> Return:
         """Run with the given arguments."""
         log.info("setting up rpkimancer library objects")
-        from ..cert import CertificateAuthority, TACertificateAuthority
+        from ..cert import CertificateAuthority, TACertificateAuthority, keys
         from ..sigobj import RouteOriginAttestation, RpkiGhostbusters
+        keys.prewarm(PREWARM_KEY_COUNT)
         # create CAs
         log.info("creating TA certificate authority")
         ta = TACertificateAuthority(as_resources=parsed_args.ta_as_resources,
-                                    ip_resources=parsed_args.ta_ip_resources)
+                                    ip_resources=parsed_args.ta_ip_resources,
+                                    private_key=keys.generate())
         log.info("creating suboridinate certificate authority")
         ca = CertificateAuthority(issuer=ta,
                                   as_resources=parsed_args.ca_as_resources,
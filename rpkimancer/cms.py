@@ -30,11 +30,13 @@ ECT = typing.TypeVar("ECT", bound="ContentType")
 class ContentInfo(Interface, typing.Generic[CT]):
     """CMS ASN.1 ContentInfo type - RFC5911."""
 
+    __slots__ = ()
+
     content_syntax = CryptographicMessageSyntax_2009.ContentInfo
 
     def __init__(self, content: CT) -> None:
         """Initialise the instance from contained ContentData."""
-        log.info(f"preparing data for {self}")
+        log.info("preparing data for %s", self)
         content_type_oid = content.content_type
         content_type_name = content.content_syntax.fullname()
         content_data = content.content_data
@@ -80,6 +82,8 @@ class ContentTypeSyntaxDescriptor:
 class ContentType(Interface):
     """CMS ASN.1 CONTENT-TYPE instance - RFC5911."""
 
+    __slots__ = ()
+
     asn1_definition: ASN1Class
 
     content_type = ContentTypeIdDescriptor()
@@ -89,17 +93,21 @@ class ContentType(Interface):
 class SignedData(ContentType):
     """CMS ASN.1 ct-SignedData CONTENT-TYPE instance - RFC5911."""
 
+    __slots__ = ()
+
     asn1_definition = CryptographicMessageSyntax_2009.ct_SignedData
 
 
 class SignedAttributes(Interface):
     """CMS ASN.1 SignedAttributes type - RFC5911."""
 
+    __slots__ = ()
+
     content_syntax = CryptographicMessageSyntax_2009.SignedAttributes
 
     def __init__(self, content_type: OID, message_digest: bytes) -> None:
         """Initialise the instance from an eContentType and eContent digest."""
-        log.info(f"preparing data for {self}")
+        log.info("preparing data for %s", self)
         ct_attr_oid = CryptographicMessageSyntax_2009.id_contentType.get_val()
         md_attr_oid = CryptographicMessageSyntax_2009.id_messageDigest.get_val()  # noqa: E501
         data = [
@@ -118,13 +126,15 @@ class SignedAttributes(Interface):
 class EncapsulatedContentInfo(Interface, typing.Generic[CT]):
     """CMS ASN.1 EncapsulatedContentInfo type - RFC5911."""
 
+    __slots__ = ()
+
     content_syntax = CryptographicMessageSyntax_2009.EncapsulatedContentInfo
 
     digest_algorithm: DigestAlgorithm
 
     def __init__(self, econtent: CT) -> None:
         """Initialise the instance from contained ContentData."""
-        log.info(f"preparing data for {self}")
+        log.info("preparing data for %s", self)
         data = {"eContentType": econtent.content_type,
                 "eContent": econtent.to_der()}
         super().__init__(data)
@@ -136,7 +146,7 @@ class EncapsulatedContentInfo(Interface, typing.Generic[CT]):
         val_path = ["content", "SignedData", "encapContentInfo"]
         with content_info.constructed() as instance:
             data = instance.get_val_at(val_path)
-        return cls.from_data(data)
+        return cls.from_data(data, validate=False)
 
     @property
     def econtent_val(self) -> typing.Any:
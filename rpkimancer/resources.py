@@ -22,8 +22,8 @@ from .asn1.mod import IPAddrAndASCertExtn
 
 log = logging.getLogger(__name__)
 
-AFI = {4: (1).to_bytes(2, "big"),
-       6: (2).to_bytes(2, "big")}
+AFI = {4: b"\x00\x01",
+       6: b"\x00\x02"}
 
 Inherit = typing.Literal["INHERIT"]
 AfiInfo = typing.Literal[4, 6]
@@ -53,7 +53,7 @@ AsResourcesInfo = typing.Union[Inherit,
 
 def net_to_bitstring(network: IPNetwork) -> IPNetworkBits:
     """Convert an IPNetwork to an ASN.1 BIT STRING representation."""
-    log.debug(f"converting {network} to rfc3779 bit string")
+    log.debug("converting %s to rfc3779 bit string", network)
     netbits = network.prefixlen
     hostbits = network.max_prefixlen - netbits
     value = int(network.network_address) >> hostbits
@@ -74,11 +74,13 @@ def bitstring_to_net(bits: IPNetworkBits, version: int) -> IPNetwork:
 class IPAddrBlocks(Interface):
     """ASN.1 IPAddrBlocks type - RFC3779."""
 
+    __slots__ = ()
+
     content_syntax = IPAddrAndASCertExtn.IPAddrBlocks
 
     def __init__(self, ip_resources: IpResourcesInfo) -> None:
         """Initialise instance from python data."""
-        log.info(f"preparing data for {self}")
+        log.info("preparing data for %s", self)
         net_data_type = typing.Union[Inherit,
                                      typing.Tuple[str, IPNetworkBits]]
         entry_type = typing.Tuple[int, net_data_type]
@@ -104,9 +106,9 @@ class IPAddrBlocks(Interface):
             else:
                 return ("addressesOrRanges", [entry for entry in entries])
 
+        net_entries = [_net_entry(data) for data in ip_resources]
         by_afi = {afi_data: [net_data
-                             for net_version, net_data
-                             in map(_net_entry, ip_resources)
+                             for net_version, net_data in net_entries
                              if net_version == afi_version]
                   for (afi_version, afi_data) in AFI.items()}
         data = [{"addressFamily": afi, "ipAddressChoice": _combine(entries)}
@@ -117,6 +119,8 @@ class IPAddrBlocks(Interface):
 class IPAddressRange(Interface):
     """ASN.1 IPAddressRange type - RFC3779."""
 
+    __slots__ = ()
+
     content_syntax = IPAddrAndASCertExtn.IPAddressRange
 
     def __init__(self, ip_range: IPRange) -> None:
@@ -145,11 +149,13 @@ class IPAddressRange(Interface):
 class ASIdOrRange(Interface):
     """ASN.1 ASIdOrRange type - RFC3779."""
 
+    __slots__ = ()
+
     content_syntax = IPAddrAndASCertExtn.ASIdOrRange
 
     def __init__(self, a: ASIdOrRangeInfo) -> None:
         """Initialise instance from python data."""
-        log.info(f"preparing data for {self}")
+        log.info("preparing data for %s", self)
         data: typing.Union[typing.Tuple[str, int],
                            typing.Tuple[str, typing.Dict[str, int]]]
         if isinstance(a, int):
@@ -162,6 +168,8 @@ class ASIdOrRange(Interface):
 class ASIdentifiers(Interface):
     """ASN.1 ASIdentifiers type - RFC3779."""
 
+    __slots__ = ()
+
     content_syntax = IPAddrAndASCertExtn.ASIdentifiers
 
     def __init__(self, as_resources: AsResourcesInfo) -> None:
@@ -170,7 +178,7 @@ class ASIdentifiers(Interface):
                             typing.Tuple[str, typing.List[typing.Any]]]
         if as_resources == INHERIT_AS:
             asnum = ("inherit", 0)
-        elif isinstance(as_resources, list):
+        elif isinstance(as_resources, (list, tuple)):
             asnum = ("asIdsOrRanges",
                      [ASIdOrRange(a).content_data for a in as_resources])
         else:  # pragma: no cover
@@ -13,12 +13,12 @@
 
 from __future__ import annotations
 
-import importlib.metadata
 import logging
 import typing
 
 from . import gbr, mft, roa
 from .base import SignedObject
+from ..utils import entry_points
 
 log = logging.getLogger(__name__)
 
@@ -35,8 +35,7 @@ def from_ext(ext: str) -> S:
                                     RpkiManifest,
                                     RouteOriginAttestation]
     entry_point_name = "rpkimancer.sigobj"
-    entry_points = importlib.metadata.entry_points()
-    for entry_point in entry_points.get(entry_point_name, []):
+    for entry_point in entry_points(entry_point_name):
         log.info(f"trying to load signed object {entry_point.value}")
         cls = entry_point.load()
         if issubclass(cls, SignedObject):
@@ -13,10 +13,13 @@
 
 from __future__ import annotations
 
+import datetime
 import logging
 import os
 import typing
 
+from cryptography.hazmat.primitives.asymmetric import rsa
+
 from ..algorithms import DIGEST_ALGORITHMS, SHA256
 from ..asn1.mod import PKIXAlgs_2009
 from ..cert import EECertificate
@@ -59,8 +62,13 @@ class EncapsulatedContentType(ContentType):
 
     def signed_attrs(self) -> SignedAttributes:
         """Construct the signedAttrs value from the EncapsulatedContentInfo."""
-        return SignedAttributes(content_type=self.content_type,
-                                message_digest=self.digest())
+        try:
+            return self._signed_attrs
+        except AttributeError:
+            signed_attrs = SignedAttributes(content_type=self.content_type,
+                                            message_digest=self.digest())
+            self._signed_attrs: SignedAttributes = signed_attrs
+        return self._signed_attrs
 
     def signed_attrs_digest(self) -> str:
         """Calculate the message digest over the DER-encoded signedAttrs."""
@@ -78,7 +86,7 @@ class SignedObject(ContentInfo[SignedData], typing.Generic[ECT]):
         """Register EncapsulatedContentInfo CONTENT-TYPE for DER encoding."""
         super().__init_subclass__(**kwargs)
         econtent_type = typing.get_args(cls.__orig_bases__[0])[0]  # type: ignore[attr-defined] # noqa: E501
-        log.info(f"Adding {econtent_type} to constraining object info set")
+        log.info("Adding %s to constraining object info set", econtent_type)
         cls.register_econtent_type(SignedData, econtent_type)
         cls.econtent_type = econtent_type
 
@@ -86,9 +94,18 @@ class SignedObject(ContentInfo[SignedData], typing.Generic[ECT]):
                  issuer: CertificateAuthority,
                  file_name: typing.Optional[str] = None,
                  *args: typing.Any,
+                 ee_key: typing.Optional[rsa.RSAPrivateKey] = None,
+                 now: typing.Optional[datetime.datetime] = None,
                  **kwargs: typing.Any) -> None:
-        """Initialise the SignedObject."""
-        log.info(f"preparing data for {self}")
+        """Initialise the SignedObject.
+
+        ee_key may be used to supply the private key of the EE certificate.
+        Sharing one key between several signed objects violates RFC6488
+        section 2.1.6.4 and must only be done for test or benchmark corpora.
+
+        now is passed to the EE certificate as its issuance timestamp.
+        """
+        log.info("preparing data for %s", self)
         # set object file name
         self._file_name = file_name
         # construct encapContentInfo
@@ -97,12 +114,16 @@ class SignedObject(ContentInfo[SignedData], typing.Generic[ECT]):
         # construct certificate
         ee_cert = self.ee_cert_cls(signed_object=self,
                                    issuer=issuer,
+                                   private_key=ee_key,
+                                   now=now,
                                    as_resources=self.econtent.as_resources,
                                    ip_resources=self.econtent.ip_resources)
         # construct signedAttrs
         signed_attrs = self.econtent.signed_attrs()
         # construct signature
         signature = ee_cert.sign_object()
+        # rfc6488 section 2.1.6.4: the EE key is used for this signature only
+        ee_cert.discard_private_key()
 
         data = {
             # rfc6488 section 2.1.1
@@ -156,7 +177,8 @@ class SignedObject(ContentInfo[SignedData], typing.Generic[ECT]):
             return self._econtent
         except AttributeError:
             econtent_data = self.econtent_info.econtent_val
-            self._econtent = self.econtent_type.from_data(econtent_data)
+            self._econtent = self.econtent_type.from_data(econtent_data,
+                                                          validate=False)
         return self._econtent
 
     @property
@@ -39,7 +39,7 @@ class RpkiGhostbustersContentType(EncapsulatedContentType):
                  tel: typing.Optional[str] = None,
                  email: typing.Optional[str] = None) -> None:
         """Initialise the encapContentInfo."""
-        log.info(f"preparing data for {self}")
+        log.info("preparing data for %s", self)
         vcard = "BEGIN:VCARD\r\n"
         vcard += "VERSION:4.0\r\n"
         vcard += f"FN:{full_name}\r\n"
@@ -44,7 +44,7 @@ class RpkiManifestContentType(EncapsulatedContentType):
                  next_update: datetime.datetime,
                  file_list: FileListInfo) -> None:
         """Initialise the encapContentInfo."""
-        log.info(f"preparing data for {self}")
+        log.info("preparing data for %s", self)
         data = {"version": version,
                 "manifestNumber": manifest_number,
                 "thisUpdate": self.generalized_time(this_update),
@@ -40,7 +40,7 @@ class RouteOriginAttestationContentType(EncapsulatedContentType):
                  as_id: int,
                  ip_address_blocks: typing.List[RoaNetworkInfo]) -> None:
         """Initialise the encapContentInfo."""
-        log.info(f"preparing data for {self}")
+        log.info("preparing data for %s", self)
         entry_type = typing.Dict[str, typing.Union[IPNetworkBits, int]]
 
         def address_entry(network: IPNetwork,
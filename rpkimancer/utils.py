@@ -13,8 +13,10 @@
 from __future__ import annotations
 
 import contextlib
+import importlib.metadata
 import io
 import logging
+import sys
 import typing
 
 log = logging.getLogger(__name__)
@@ -22,6 +24,18 @@ log = logging.getLogger(__name__)
 LogLevelCallback = typing.Callable[[str], int]
 
 
+def entry_points(group: str) -> typing.Iterable[importlib.metadata.EntryPoint]:
+    """Get the installed entry points in group.
+
+    Uses the selectable API where available (python >= 3.10) so that only
+    matching entry points are materialised.
+    """
+    if sys.version_info >= (3, 10):
+        return importlib.metadata.entry_points(group=group)
+    else:
+        return importlib.metadata.entry_points().get(group, [])
+
+
 class LogWriter(io.TextIOBase):
     """File-like object for stream-to-log redirection."""
 
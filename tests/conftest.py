@@ -0,0 +1,62 @@
+# Copyright (c) 2021 Ben Maddison. All rights reserved.
+#
+# The contents of this file are licensed under the MIT License
+# (the "License"); you may not use this file except in compliance with the
+# License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Shared fixtures for rpkimancer tests."""
+
+from __future__ import annotations
+
+import copy
+import importlib.abc
+import importlib.metadata
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def patch_meta_path():
+    """Inject a dummy plugin distribution into 'meta_path'."""
+
+    class DummyDistribution(importlib.metadata.Distribution):
+        def read_text(self, filename):
+            if filename == "PKG-INFO":
+                text = ["Metadata-Version: 2.1",
+                        "Name: rpkimancer-foo",
+                        "Version: 0.0.1"]
+            elif filename == "entry_points.txt":
+                text = ["[rpkimancer.asn1.modules]",
+                        "RpkiFoo = rpkimancer_foo.asn1",
+                        "[rpkimancer.cli.conjure]",
+                        "ConjureFoo = rpkimancer_foo.conjure:ConjureFoo",
+                        "[rpkimancer.sigobj]",
+                        "FooObject = rpkimancer_foo.sigobj:FooObject"]
+            else:
+                return ""
+            return "\n".join(text)
+
+        def locate_file(self, path):
+            raise NotImplementedError
+
+    dummy_finder_ctx = importlib.metadata.DistributionFinder.Context()
+
+    class DummyMetaPathFinder(importlib.abc.MetaPathFinder):
+        def find_spec(self, fullname, path, target=None):
+            return None
+
+        def find_distributions(self, context=dummy_finder_ctx):
+            yield DummyDistribution()
+
+    try:
+        old_meta_path = copy.copy(sys.meta_path)
+        sys.meta_path.append(DummyMetaPathFinder)
+        yield
+    finally:
+        sys.meta_path = old_meta_path
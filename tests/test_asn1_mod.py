@@ -0,0 +1,107 @@
+# Copyright (c) 2021 Ben Maddison. All rights reserved.
+#
+# The contents of this file are licensed under the MIT License
+# (the "License"); you may not use this file except in compliance with the
+# License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""rpkimancer ASN.1 module compilation tests."""
+
+from __future__ import annotations
+
+import importlib.metadata
+import logging
+
+import pytest
+
+
+@pytest.fixture
+def compiler(monkeypatch):
+    """Replace the pycrates compiler with a recording stub."""
+    import pycrate_asn1c.asnproc
+    import pycrate_asn1c.generator
+    import rpkimancer.asn1.mod
+    # the star import of the generated module shadows the module logger
+    monkeypatch.setattr(rpkimancer.asn1.mod, "log",
+                        logging.getLogger(rpkimancer.asn1.mod.__name__))
+    calls = list()
+
+    def compile_text(mods):
+        calls.append(list(mods))
+
+    def generator(dest):
+        with open(dest, "w") as f:
+            f.write("# generated\n")
+
+    monkeypatch.setattr(pycrate_asn1c.asnproc, "compile_text", compile_text)
+    monkeypatch.setattr(pycrate_asn1c.generator, "PycrateGenerator", generator)
+    return calls
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Set up a modules directory and generated module output path."""
+    mods_dir = tmp_path / "modules"
+    (mods_dir / "nested").mkdir(parents=True)
+    (mods_dir / "A.asn").write_text("A DEFINITIONS ::= BEGIN END\n")
+    (mods_dir / "nested" / "B.asn").write_text("B DEFINITIONS ::= BEGIN END\n")
+    return mods_dir, tmp_path / "_mod.py"
+
+
+@pytest.mark.usefixtures("patch_meta_path")
+class TestCompileModules:
+    """Test cases for the generated module cache."""
+
+    def test_compiles_when_missing(self, compiler, sources):
+        """Test that all sources are compiled and the digest is recorded."""
+        from rpkimancer.asn1.mod import (DIGEST_HEADER, _compile_modules,
+                                         _generated_digest)
+        mods_dir, output_path = sources
+        _compile_modules(str(mods_dir), str(output_path))
+        assert len(compiler) == 1
+        assert compiler[0][:2] == [(mods_dir / "A.asn").read_text(),
+                                   (mods_dir / "nested" / "B.asn").read_text()]
+        assert output_path.read_text().startswith(DIGEST_HEADER)
+        assert _generated_digest(str(output_path)) is not None
+
+    def test_skips_when_unchanged(self, compiler, sources):
+        """Test that an unchanged digest skips compilation."""
+        from rpkimancer.asn1.mod import _compile_modules
+        mods_dir, output_path = sources
+        _compile_modules(str(mods_dir), str(output_path))
+        _compile_modules(str(mods_dir), str(output_path))
+        assert len(compiler) == 1
+
+    def test_recompiles_on_source_change(self, compiler, sources):
+        """Test that changing a source module forces recompilation."""
+        from rpkimancer.asn1.mod import _compile_modules
+        mods_dir, output_path = sources
+        _compile_modules(str(mods_dir), str(output_path))
+        (mods_dir / "nested" / "B.asn").write_text("B DEFINITIONS ::= BEGIN\n"
+                                                   "b INTEGER ::= 1\n"
+                                                   "END\n")
+        _compile_modules(str(mods_dir), str(output_path))
+        assert len(compiler) == 2
+
+    def test_recompiles_on_compiler_change(self, compiler, sources,
+                                           monkeypatch):
+        """Test that a different pycrate version forces recompilation."""
+        from rpkimancer.asn1.mod import _compile_modules
+        mods_dir, output_path = sources
+        _compile_modules(str(mods_dir), str(output_path))
+        monkeypatch.setattr(importlib.metadata, "version",
+                            lambda name: "0.0.0")
+        _compile_modules(str(mods_dir), str(output_path))
+        assert len(compiler) == 2
+
+    def test_recompiles_without_header(self, compiler, sources):
+        """Test that a generated module without a digest is replaced."""
+        from rpkimancer.asn1.mod import _compile_modules
+        mods_dir, output_path = sources
+        output_path.write_text("# -*- coding: UTF-8 -*-\n")
+        _compile_modules(str(mods_dir), str(output_path))
+        assert len(compiler) == 1
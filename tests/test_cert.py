@@ -0,0 +1,174 @@
+# Copyright (c) 2021 Ben Maddison. All rights reserved.
+#
+# The contents of this file are licensed under the MIT License
+# (the "License"); you may not use this file except in compliance with the
+# License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""rpkimancer certificate and signed object tests."""
+
+from __future__ import annotations
+
+import datetime
+import ipaddress
+
+import pytest
+
+NOW = datetime.datetime(2021, 6, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def ta():
+    """Set up a trust anchor CA to issue test objects."""
+    from rpkimancer.cert import TACertificateAuthority
+    return TACertificateAuthority(as_resources=[(0, 4294967295)],
+                                  ip_resources=[ipaddress.ip_network("0.0.0.0/0"),  # noqa: E501
+                                                ipaddress.ip_network("::0/0")])  # noqa: E501
+
+
+def roa(issuer, **kwargs):
+    """Issue a ROA for a fixed prefix."""
+    from rpkimancer.sigobj import RouteOriginAttestation
+    return RouteOriginAttestation(issuer=issuer,
+                                  as_id=65000,
+                                  ip_address_blocks=[(ipaddress.ip_network("10.0.0.0/8"), None)],  # noqa: E501
+                                  **kwargs)
+
+
+def last_issued(ca):
+    """Get the certificate most recently issued by ca."""
+    return ca.issued[-1]
+
+
+@pytest.mark.usefixtures("patch_meta_path")
+class TestIssuanceTime:
+    """Test cases for shared issuance timestamps."""
+
+    def test_signed_object_ee_now(self, ta):
+        """Test that a signed object's EE certificate uses 'now'."""
+        roa(ta, now=NOW)
+        assert last_issued(ta).cert.not_valid_before == NOW
+
+    def test_manifest_ee_now(self, ta):
+        """Test that a manifest's EE certificate shares 'now'."""
+        ta.issue_mft([], now=NOW)
+        assert last_issued(ta).cert.not_valid_before == NOW
+
+
+@pytest.mark.usefixtures("patch_meta_path")
+class TestHashAlgorithm:
+    """Test cases for the signature hash algorithm."""
+
+    def test_hash_algorithm_class(self, ta):
+        """Test that hash_algorithm can still be instantiated."""
+        from cryptography.hazmat.primitives import hashes
+        assert isinstance(ta.hash_algorithm(), hashes.SHA256)
+
+    def test_shared_instance(self, ta):
+        """Test that certificates are signed using SHA256."""
+        from rpkimancer.cert.base import HASH_ALGORITHM
+        assert isinstance(HASH_ALGORITHM, ta.hash_algorithm)
+        assert ta.cert.signature_hash_algorithm.name == HASH_ALGORITHM.name
+
+
+@pytest.mark.usefixtures("patch_meta_path")
+class TestPublicKeyInfo:
+    """Test cases for the encoded subjectPublicKeyInfo."""
+
+    def test_spki_der(self, ta):
+        """Test that spki_der matches the issued certificate."""
+        from cryptography.hazmat.primitives import serialization
+        spki = ta.cert.public_key().public_bytes(serialization.Encoding.DER,
+                                                 serialization.PublicFormat.SubjectPublicKeyInfo)  # noqa: E501
+        assert ta.spki_der == spki
+        assert ta.asn1_cert.subject_public_key_info.to_der() == spki
+
+    def test_tal(self, ta):
+        """Test that the TAL carries the certificate's SPKI."""
+        import base64
+        assert base64.b64decode(ta.tal.splitlines()[-1]) == ta.spki_der
+
+
+@pytest.mark.usefixtures("patch_meta_path")
+class TestRevocation:
+    """Test cases for CRL issuance."""
+
+    def test_expired_entries_pruned(self, ta):
+        """Test that expired revoked certificates are dropped from the CRL."""
+        from rpkimancer.cert import CertificateAuthority
+        issuer = CertificateAuthority(issuer=ta, common_name="Issuer",
+                                      as_resources=[(65000, 65000)],
+                                      now=NOW)
+        revoked = CertificateAuthority(issuer=issuer, common_name="Revoked",
+                                       as_resources=[(65000, 65000)],
+                                       days=1, now=NOW)
+        day = datetime.timedelta(days=1)
+        issuer.issue_crl([revoked], now=NOW)
+        assert len(list(issuer.crl)) == 1
+        # still listed on the first CRL issued after expiry
+        issuer.issue_crl(now=NOW + 2 * day)
+        assert len(list(issuer.crl)) == 1
+        issuer.issue_crl(now=NOW + 3 * day)
+        assert len(list(issuer.crl)) == 0
+
+
+@pytest.mark.usefixtures("patch_meta_path")
+class TestPrivateKey:
+    """Test cases for private key handling."""
+
+    def test_wrong_key_size(self, ta):
+        """Test that keys of the wrong size are rejected."""
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        from rpkimancer.cert import CertificateAuthority
+        key = rsa.generate_private_key(public_exponent=65537,  # noqa: S505
+                                       key_size=1024)
+        with pytest.raises(ValueError):
+            CertificateAuthority(issuer=ta, as_resources=[(65000, 65000)],
+                                 private_key=key)
+
+    def test_ee_key(self, ta):
+        """Test that a supplied ee_key is used for the EE certificate."""
+        from rpkimancer.cert import keys
+        key = keys.generate()
+        roa(ta, ee_key=key)
+        ee_cert = last_issued(ta)
+        assert ee_cert.public_key.public_numbers() == key.public_key().public_numbers()  # noqa: E501
+
+    def test_discarded_key(self, ta):
+        """Test that the EE private key is unavailable after signing."""
+        roa(ta)
+        with pytest.raises(ValueError):
+            last_issued(ta).private_key
+
+
+@pytest.mark.usefixtures("patch_meta_path")
+class TestResources:
+    """Test cases for resource extensions."""
+
+    networks = ("10.0.0.0/8", "2001:db8::/32")
+
+    def test_ip_addr_blocks_generator(self):
+        """Test that IPAddrBlocks consumes a one-shot iterable once."""
+        from rpkimancer.resources import AFI, IPAddrBlocks
+        ip_addr_blocks = IPAddrBlocks(ipaddress.ip_network(n)
+                                      for n in self.networks)
+        families = [block["addressFamily"]
+                    for block in ip_addr_blocks.content_data]
+        assert families == [AFI[4], AFI[6]]
+
+    def test_ip_resources_generator(self, ta):
+        """Test that both address families survive a one-shot iterable."""
+        from rpkimancer.cert import CertificateAuthority, oid
+        from rpkimancer.resources import AFI, IPAddrBlocks
+        ca = CertificateAuthority(issuer=ta,
+                                  ip_resources=(ipaddress.ip_network(n)
+                                                for n in self.networks))
+        ext = ca.cert.extensions.get_extension_for_oid(oid.IP_RESOURCES_OID)
+        ip_addr_blocks = IPAddrBlocks.from_der(ext.value.value)
+        families = [block["addressFamily"]
+                    for block in ip_addr_blocks.content_data]
+        assert families == [AFI[4], AFI[6]]
@@ -13,14 +13,10 @@
 
 from __future__ import annotations
 
-import copy
-import importlib.abc
-import importlib.metadata
 import ipaddress
 import logging
 import os
 import subprocess
-import sys
 
 import pytest
 
@@ -33,47 +29,6 @@ def target_directory(tmp_path_factory):
     return tmp_path_factory.mktemp("target")
 
 
-@pytest.fixture(scope="session")
-def patch_meta_path():
-    """Inject a dummy plugin distribution into 'meta_path'."""
-
-    class DummyDistribution(importlib.metadata.Distribution):
-        def read_text(self, filename):
-            if filename == "PKG-INFO":
-                text = ["Metadata-Version: 2.1",
-                        "Name: rpkimancer-foo",
-                        "Version: 0.0.1"]
-            elif filename == "entry_points.txt":
-                text = ["[rpkimancer.asn1.modules]",
-                        "RpkiFoo = rpkimancer_foo.asn1",
-                        "[rpkimancer.cli.conjure]",
-                        "ConjureFoo = rpkimancer_foo.conjure:ConjureFoo",
-                        "[rpkimancer.sigobj]",
-                        "FooObject = rpkimancer_foo.sigobj:FooObject"]
-            else:
-                return ""
-            return "\n".join(text)
-
-        def locate_file(self, path):
-            raise NotImplementedError
-
-    dummy_finder_ctx = importlib.metadata.DistributionFinder.Context()
-
-    class DummyMetaPathFinder(importlib.abc.MetaPathFinder):
-        def find_spec(self, fullname, path, target=None):
-            return None
-
-        def find_distributions(self, context=dummy_finder_ctx):
-            yield DummyDistribution()
-
-    try:
-        old_meta_path = copy.copy(sys.meta_path)
-        sys.meta_path.append(DummyMetaPathFinder)
-        yield
-    finally:
-        sys.meta_path = old_meta_path
-
-
 @pytest.mark.usefixtures("patch_meta_path")
 class TestCli:
     """Test cases for rpkimancer CLI tools."""
@@ -0,0 +1,78 @@
+# Copyright (c) 2021 Ben Maddison. All rights reserved.
+#
+# The contents of this file are licensed under the MIT License
+# (the "License"); you may not use this file except in compliance with the
+# License.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""rpkimancer key pair pool tests."""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def keys(patch_meta_path):
+    """Import the keys module once the test plugin is registered."""
+    from rpkimancer.cert import keys
+    return keys
+
+
+@pytest.fixture
+def pool(keys, monkeypatch):
+    """Replace the key pool and key generation with cheap stand-ins."""
+    generated = list()
+
+    def generate():
+        key = object()
+        generated.append((threading.current_thread().name, key))
+        return key
+
+    monkeypatch.setattr(keys, "_pool", queue.SimpleQueue())
+    monkeypatch.setattr(keys, "generate", generate)
+    return generated
+
+
+class TestKeys:
+    """Test cases for rpkimancer.cert.keys."""
+
+    def test_generate(self, keys):
+        """Test that generated keys meet the RPKI algorithm profile."""
+        key = keys.generate()
+        assert key.key_size == keys.KEY_SIZE
+        assert key.public_key().public_numbers().e == keys.PUBLIC_EXPONENT
+
+    def test_prewarm_get(self, keys, pool):
+        """Test that get() returns keys generated by prewarm()."""
+        for thread in keys.prewarm(3, workers=2):
+            thread.join(timeout=10)
+        assert len(pool) == 3
+        assert all(name.startswith("rpkimancer-keygen-")
+                   for name, _ in pool)
+        prewarmed = {key for _, key in pool}
+        assert {keys.get() for _ in range(3)} == prewarmed
+
+    def test_get_empty_pool(self, keys, pool):
+        """Test that get() generates a key inline when the pool is empty."""
+        key = keys.get()
+        assert pool == [(threading.current_thread().name, key)]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+    def test_fork_clears_pool(self, keys, pool):
+        """Test that a forked child does not inherit pre-generated keys."""
+        keys._pool.put(object())
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            os._exit(0 if keys._pool.empty() else 1)
+        _, status = os.waitpid(pid, 0)
+        assert status == 0
+        assert not keys._pool.empty()